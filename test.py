@@ -1,23 +1,34 @@
 #!/usr/bin/env python3
+import hashlib
+import json
+import os
+import tempfile
 import unittest
+from functools import lru_cache
 import rdflib  # type: ignore
 from transformation_algebra import error
 
 from cct import algebra, R1, R2, Obj, Ratio
 
 
+@lru_cache(maxsize=None)
+def _parse_type(string):
+    # Many tool descriptions share the same expression, so parse each unique
+    # string only once. Only the plain type is kept, so that tests never share
+    # the parsed expression itself
+    return algebra.parse(string).type.plain()
+
+
 class TestCCT(unittest.TestCase):
     def parse(self, string, result=None):
         if result is None:
             # if the result is unknown, just check if it contains any
             # unresolved variables
-            self.assertTrue(
-                not any(algebra.parse(string).type.plain().variables()))
+            self.assertTrue(not any(_parse_type(string).variables()))
         elif isinstance(result, type) and issubclass(result, Exception):
             self.assertRaises(result, algebra.parse, string)
         else:
-            self.assertEqual(algebra.parse(string).type.plain(),
-                    result.plain())
+            self.assertEqual(_parse_type(string), result.plain())
 
     def test_projection(self):
         self.parse(
@@ -198,10 +209,62 @@ class TestCCT(unittest.TestCase):
 # Also test algebra expressions from RDF file
 TOOLS = rdflib.Namespace("http://geographicknowledge.de/vocab/GISTools.rdf#")
 path = "ToolDescription_TransformationAlgebra.ttl"
-g = rdflib.Graph()
-g.parse(path, format=rdflib.util.guess_format(path))
-for s, o in g.subject_objects(TOOLS.algebraexpression):
-    setattr(TestCCT, f"test_{s}", lambda x: x.parse(o))
+
+# Bump whenever the way expressions are extracted from the RDF file changes
+CACHE_VERSION = 1
+
+
+def _digest(key, exprs):
+    # Guards against a damaged cache that still happens to be valid JSON
+    data = json.dumps([key, exprs], ensure_ascii=False).encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+
+def _load_exprs(path):
+    """
+    Extract the algebra expressions of all tools in the given RDF file. Since
+    parsing the file is slow, the result is cached next to it and reused for
+    as long as the file's modification time and size stay the same. A cache
+    that cannot be read or written is simply ignored.
+    """
+    stat = os.stat(path)
+    key = [CACHE_VERSION, str(TOOLS.algebraexpression),
+        stat.st_mtime_ns, stat.st_size]
+    cache = path + ".cache.json"
+    try:
+        with open(cache, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        exprs = [(s, o) for s, o in data["exprs"]]
+        if (data["key"] == key and data["digest"] == _digest(key, exprs)
+                and all(isinstance(s, str) and isinstance(o, str)
+                    for s, o in exprs)):
+            return exprs
+    except Exception:
+        pass
+
+    g = rdflib.Graph()
+    g.parse(path, format=rdflib.util.guess_format(path))
+    exprs = [(str(s), str(o))
+        for s, o in g.subject_objects(TOOLS.algebraexpression)]
+    try:
+        fd, tmp = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(cache)),
+            prefix=os.path.basename(cache) + ".")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"key": key, "exprs": exprs,
+                    "digest": _digest(key, exprs)}, f)
+            os.replace(tmp, cache)
+        except BaseException:
+            os.remove(tmp)
+            raise
+    except OSError:
+        pass
+    return exprs
+
+
+for s, o in _load_exprs(path):
+    setattr(TestCCT, f"test_{s}", lambda x, expr=o: x.parse(expr))
 
 
 if __name__ == '__main__':